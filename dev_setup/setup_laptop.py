@@ -1,28 +1,119 @@
 #!/usr/bin/env python3
 
+# Only the modules every run needs are imported here, the rest is imported where it's used
+# so the script starts probing right away (budget enforced by test_setup_laptop.py).
 import argparse
 import os
 import re
 import sys
 import subprocess
-import getpass
-from typing import Tuple
+import threading
+import time
 
-try:
-    from tqdm import tqdm
-except ImportError:
-    print("Installing tqdm for progress display...")  # Can't use tqdm.write yet
-    subprocess.check_call([sys.executable, '-m', 'pip', 'install', 'tqdm', '-q'])
-    from tqdm import tqdm
+
+class ProgressBar:
+    """
+    Minimal tqdm replacement, so the script runs on a fresh laptop without installing anything.
+    Draws a single green bar on stderr (only on a terminal) and clears it when done.
+    """
+    _active = None
+    _paused = False
+    _lock = threading.Lock()
+
+    def __init__(self, total: int, desc: str = '', width: int = 30):
+        self.total = total
+        self.desc = desc
+        self.width = width
+        self.n = 0
+        self.postfix = ''
+        self.start_time = time.monotonic()
+        self.enabled = sys.stderr.isatty()
+
+    def __enter__(self) -> 'ProgressBar':
+        with ProgressBar._lock:
+            ProgressBar._active = self
+            self._render()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        with ProgressBar._lock:
+            self._clear()
+            ProgressBar._active = None
+
+    def update(self, n: int = 1):
+        with ProgressBar._lock:
+            self.n += n
+            self._render()
+
+    def set_postfix_str(self, postfix: str):
+        with ProgressBar._lock:
+            self.postfix = postfix
+            self._render()
+
+    @staticmethod
+    def _format_seconds(seconds: float) -> str:
+        minutes, seconds = divmod(int(seconds), 60)
+        return f'{minutes:02d}:{seconds:02d}'
+
+    @classmethod
+    def pause(cls):
+        """Hide the bar while a step may prompt on the terminal, redrawing it would wipe the prompt."""
+        with cls._lock:
+            cls._paused = True
+            if cls._active:
+                cls._active._clear()
+
+    @classmethod
+    def resume(cls):
+        with cls._lock:
+            cls._paused = False
+            if cls._active:
+                cls._active._render()
+
+    def _render(self):
+        if not self.enabled or ProgressBar._paused:
+            return
+        elapsed = time.monotonic() - self.start_time
+        fraction = self.n / self.total if self.total else 1.0
+        filled = int(fraction * self.width)
+        remaining = self._format_seconds(elapsed / self.n * (self.total - self.n)) if self.n else '?'
+        postfix = f', {self.postfix}' if self.postfix else ''
+        line = (f'{self.desc}: {fraction * 100:3.0f}%|{Colors.OKGREEN}{"█" * filled}{" " * (self.width - filled)}{Colors.ENDC}'
+                f'| {self.n}/{self.total} [{self._format_seconds(elapsed)}<{remaining}{postfix}]')
+        sys.stderr.write('\r' + line + '\033[K')
+        sys.stderr.flush()
+
+    def _clear(self):
+        if self.enabled:
+            sys.stderr.write('\r\033[K')
+            sys.stderr.flush()
+
+    @classmethod
+    def write(cls, message: str, end: str = '\n'):
+        """Print a message above the active progress bar, if any."""
+        with cls._lock:
+            bar = cls._active
+            if bar:
+                bar._clear()
+            sys.stdout.write(message + end)
+            sys.stdout.flush()
+            if bar:
+                bar._render()
 
 
 def log(message: str, end: str = '\n'):
-    """Print a message using tqdm.write to avoid interfering with progress bars."""
-    tqdm.write(message, end=end)
+    """Print a message using ProgressBar.write to avoid interfering with progress bars."""
+    ProgressBar.write(message, end=end)
 
 # Global dry-run flag
 DRY_RUN = False
 
+# Preflight checks started in unattended (--yes) mode, ResourceExecutor waits on them before the first install
+PREFLIGHT = None
+
 # =============================================================================
 # Version Configuration - All tool versions consolidated here
 # =============================================================================
@@ -35,6 +126,41 @@ JAVA_VERSION = "21"
 ZULU_JDK_VERSION = "21.32.17"
 ZULU_JDK_RELEASE = "21.0.2"
 
+# =============================================================================
+# Build Cache Configuration
+# =============================================================================
+# Prebuilt pyenv python versions are archived here after a successful build, so later
+# installs can unpack them instead of compiling CPython again. Point this at a shared
+# directory (e.g. a mounted network drive) to reuse builds across laptops.
+PYTHON_BUILD_CACHE_DIR = os.environ.get(
+    'SETUP_LAPTOP_PYTHON_CACHE', os.path.expanduser('~/.cache/setup_laptop/python-builds')
+)
+# Env vars that change the resulting build and therefore must be part of the cache key
+PYTHON_BUILD_FLAG_VARS = ('PYTHON_CONFIGURE_OPTS', 'CONFIGURE_OPTS', 'PYTHON_CFLAGS', 'CFLAGS', 'LDFLAGS', 'CPPFLAGS')
+# Homebrew libraries the build links against, their versions are part of the cache key
+PYTHON_BUILD_BREW_DEPS = ('openssl@3', 'readline', 'xz', 'tcl-tk')
+# Marker file stored inside the archive recording the prefix the build was made for
+PYTHON_BUILD_PREFIX_MARKER = '.setup_laptop_build_prefix'
+
+# =============================================================================
+# Preflight Configuration - Used instead of the prompts in unattended (--yes) mode
+# =============================================================================
+# host:port that is only reachable from the corporate network / VPN, required in unattended mode
+CORP_NETWORK_PROBE = os.environ.get('SETUP_LAPTOP_NETWORK_PROBE', '')
+NETWORK_PROBE_TIMEOUT_SECONDS = 5
+MIN_FREE_DISK_GB = 10
+
+# =============================================================================
+# Concurrency Configuration - Install steps are tagged with the resources they contend for
+# =============================================================================
+RESOURCE_CPU = 'cpu'              # One token per core, only CPU-bound steps (the python build takes all)
+RESOURCE_NETWORK = 'network'      # Concurrent downloads (curl installers, bottles, JDK tarball)
+RESOURCE_BREW_LOCK = 'brew'       # Homebrew serializes on its own lock anyway
+RESOURCE_ZSHRC_LOCK = 'zshrc'     # Steps appending to ~/.zshrc
+RESOURCE_INTERACTIVE = 'interactive'  # Steps that may prompt on the terminal (sudo), one at a time
+CPU_SLOTS = os.cpu_count() or 1
+NETWORK_SLOTS = 4
+
 
 class Colors:
     OKGREEN = '\033[92m'
@@ -75,7 +201,7 @@ def compare_versions(version1: str, version2: str) -> int:
     return 0
 
 
-def ensure_nvm_loaded() -> Tuple[str, str]:
+def ensure_nvm_loaded() -> tuple[str, str]:
     """
     Ensure NVM environment is set up and return NVM_DIR and init script path.
     Attempts to run 'nvm use --delete-prefix' to fix any prefix issues.
@@ -118,6 +244,213 @@ def append_to_zshrc_if_missing(content: str, marker: str) -> bool:
     return True
 
 
+def get_pyenv_version_prefix(version: str) -> str:
+    """Return the directory pyenv installs the given python version into."""
+    pyenv_root = os.environ.get('PYENV_ROOT', os.path.expanduser('~/.pyenv'))
+    return os.path.join(pyenv_root, 'versions', version)
+
+
+def python_build_cache_key() -> str:
+    """
+    Build the cache key for a prebuilt python: version, architecture, OS version, configure flags
+    and the versions of the brew libraries it links against (_ssl, _lzma, readline, tkinter).
+    Only the OS major version is used, builds are compatible across minor macOS updates.
+    """
+    import hashlib
+    import platform
+
+    mac_version = platform.mac_ver()[0]
+    if mac_version:
+        os_name = f'macos{mac_version.split(".")[0]}'
+    else:
+        os_name = f'{platform.system().lower()}{platform.release().split(".")[0]}'
+
+    try:
+        brew_deps = subprocess.run(['brew', 'list', '--versions', *PYTHON_BUILD_BREW_DEPS],
+                                   stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True).stdout
+    except FileNotFoundError:
+        brew_deps = ''
+    build_flags = '\n'.join(f'{var}={os.environ.get(var, "")}' for var in PYTHON_BUILD_FLAG_VARS)
+    build_digest = hashlib.sha256(f'{build_flags}\n{brew_deps}'.encode('utf-8')).hexdigest()[:12]
+    return f'cpython-{PYTHON_VERSION_TO_INSTALL}-{platform.machine()}-{os_name}-{build_digest}'
+
+
+def file_sha256(path: str) -> str:
+    """Return the hex sha256 digest of a file."""
+    import hashlib
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def safe_extract_tar(archive, dest_dir: str):
+    """
+    Extract a tarfile into dest_dir, refusing members that would end up outside of it.
+    Uses the 'tar' extraction filter where available (python 3.12+ and security backports),
+    otherwise checks every member's resolved path and link target itself.
+    """
+    import tarfile
+
+    if hasattr(tarfile, 'tar_filter'):
+        archive.extractall(dest_dir, filter='tar')
+        return
+
+    dest_dir = os.path.realpath(dest_dir)
+
+    def check_inside(path: str, member_name: str):
+        if os.path.commonpath([dest_dir, os.path.realpath(path)]) != dest_dir:
+            raise ValueError(f"archive member '{member_name}' points outside of {dest_dir}")
+
+    for member in archive.getmembers():
+        target = os.path.join(dest_dir, member.name)
+        check_inside(target, member.name)
+        if member.issym():
+            check_inside(os.path.join(os.path.dirname(target), member.linkname), member.name)
+        elif member.islnk():
+            check_inside(os.path.join(dest_dir, member.linkname), member.name)
+        elif not (member.isfile() or member.isdir()):
+            raise ValueError(f"archive member '{member.name}' is not a file, directory or link")
+    archive.extractall(dest_dir)
+
+
+def get_python_build_archive_path() -> str:
+    """Return the path of the cached build archive for the current python version and machine."""
+    return os.path.join(PYTHON_BUILD_CACHE_DIR, f'{python_build_cache_key()}.tar.gz')
+
+
+def relocate_python_build(prefix: str, old_prefix: str):
+    """
+    Rewrite references to the prefix a cached python was built for (shebangs of pip & co,
+    sysconfig data, pkg-config files). Binaries find their prefix relative to the executable,
+    only a shared libpython (--enable-shared) needs its install name fixed.
+    """
+    old_prefix_bytes = old_prefix.encode('utf-8')
+    new_prefix_bytes = prefix.encode('utf-8')
+
+    for dirpath, _, filenames in os.walk(prefix):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            if os.path.islink(path) or os.path.getsize(path) > 5 * 1024 * 1024:
+                continue
+            with open(path, 'rb') as f:
+                data = f.read()
+            # Skip binaries, their embedded prefix is only a fallback
+            if b'\0' in data[:8192] or old_prefix_bytes not in data:
+                continue
+            with open(path, 'wb') as f:
+                f.write(data.replace(old_prefix_bytes, new_prefix_bytes))
+
+    lib_dir = os.path.join(prefix, 'lib')
+    for filename in os.listdir(lib_dir):
+        if not (filename.startswith('libpython') and filename.endswith('.dylib')) or os.path.islink(os.path.join(lib_dir, filename)):
+            continue
+        old_lib_path = os.path.join(old_prefix, 'lib', filename)
+        new_lib_path = os.path.join(lib_dir, filename)
+        subprocess.check_output(['install_name_tool', '-id', new_lib_path, new_lib_path], stderr=subprocess.STDOUT)
+        bin_dir = os.path.join(prefix, 'bin')
+        for binary in os.listdir(bin_dir):
+            binary_path = os.path.join(bin_dir, binary)
+            if binary.startswith('python') and not os.path.islink(binary_path) and not binary.endswith('-config'):
+                subprocess.run(['install_name_tool', '-change', old_lib_path, new_lib_path, binary_path],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def restore_python_from_cache() -> bool:
+    """
+    Unpack a cached prebuilt python into pyenv's versions directory and relocate it if needed.
+    Returns True if the cached build was restored, False if there is none or it couldn't be used.
+    """
+    import shutil
+    import tarfile
+    import tempfile
+
+    archive_path = get_python_build_archive_path()
+    if not os.path.isfile(archive_path):
+        return False
+
+    # The cache may be shared, only use archives that match the checksum written next to them
+    checksum_path = f'{archive_path}.sha256'
+    try:
+        with open(checksum_path, 'r') as f:
+            expected_checksum = f.read().strip()
+    except OSError:
+        log(Colors.BLUE + f"Ignoring cached python build without checksum ({checksum_path})." + Colors.ENDC)
+        return False
+    if file_sha256(archive_path) != expected_checksum:
+        log(Colors.BLUE + f"Ignoring cached python build with mismatching checksum ({archive_path})." + Colors.ENDC)
+        return False
+
+    prefix = get_pyenv_version_prefix(PYTHON_VERSION_TO_INSTALL)
+    versions_dir = os.path.dirname(prefix)
+    os.makedirs(versions_dir, exist_ok=True)
+    # Extract next to the final location so the move into place is a rename
+    staging_dir = tempfile.mkdtemp(prefix='.setup_laptop-', dir=versions_dir)
+    try:
+        with tarfile.open(archive_path, 'r:gz') as archive:
+            safe_extract_tar(archive, staging_dir)
+        staged_prefix = os.path.join(staging_dir, PYTHON_VERSION_TO_INSTALL)
+        marker_path = os.path.join(staged_prefix, PYTHON_BUILD_PREFIX_MARKER)
+        with open(marker_path, 'r') as f:
+            old_prefix = f.read().strip()
+        os.remove(marker_path)
+
+        os.rename(staged_prefix, prefix)
+        if old_prefix != prefix:
+            relocate_python_build(prefix, old_prefix)
+        # pyenv install does this itself, a restored version needs its shims created explicitly
+        subprocess.run(['pyenv', 'rehash'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        log(Colors.OKGREEN + f"    python {PYTHON_VERSION_TO_INSTALL} restored from build cache ({archive_path})." + Colors.ENDC)
+        return True
+    except Exception as e:
+        log(Colors.BLUE + f"Could not use cached python build, building from source instead: {e}" + Colors.ENDC)
+        if os.path.exists(prefix):
+            shutil.rmtree(prefix, ignore_errors=True)
+        return False
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def save_python_to_cache():
+    """Archive the freshly built python into the build cache. Failures are non-critical."""
+    import tarfile
+    import tempfile
+
+    prefix = get_pyenv_version_prefix(PYTHON_VERSION_TO_INSTALL)
+    archive_path = get_python_build_archive_path()
+    checksum_path = f'{archive_path}.sha256'
+    marker_path = os.path.join(prefix, PYTHON_BUILD_PREFIX_MARKER)
+    try:
+        os.makedirs(PYTHON_BUILD_CACHE_DIR, exist_ok=True)
+        with open(marker_path, 'w') as f:
+            f.write(prefix)
+        # Write to temp files first so a shared cache never exposes a half-written archive
+        fd, tmp_path = tempfile.mkstemp(suffix='.tar.gz.tmp', dir=PYTHON_BUILD_CACHE_DIR)
+        os.close(fd)
+        fd, tmp_checksum_path = tempfile.mkstemp(suffix='.sha256.tmp', dir=PYTHON_BUILD_CACHE_DIR)
+        os.close(fd)
+        try:
+            # Fast compression, this runs right after the build on the slow path
+            with tarfile.open(tmp_path, 'w:gz', compresslevel=1) as archive:
+                archive.add(prefix, arcname=PYTHON_VERSION_TO_INSTALL)
+            with open(tmp_checksum_path, 'w') as f:
+                f.write(file_sha256(tmp_path))
+            os.replace(tmp_checksum_path, checksum_path)
+            os.replace(tmp_path, archive_path)
+        finally:
+            for path in (tmp_path, tmp_checksum_path):
+                if os.path.exists(path):
+                    os.remove(path)
+        log(Colors.OKGREEN + f"    python {PYTHON_VERSION_TO_INSTALL} build cached at {archive_path}." + Colors.ENDC)
+    except Exception as e:
+        log(Colors.BLUE + f"Could not cache python build: {e}" + Colors.ENDC)
+    finally:
+        if os.path.exists(marker_path):
+            os.remove(marker_path)
+
+
 class UserInteraction:
     def ask_user_connection(self):
         response = input("Are you connected to CORS-CORP wifi in the office or VPN, otherwise (Yes/No): ")
@@ -129,6 +462,8 @@ class UserInteraction:
             return False
 
     def is_username_correct(self):
+        import getpass
+
         try:
             username = getpass.getuser()
             response = input("Is your username the same as " + Colors.BLUE + username + Colors.ENDC + "? (Yes/No): ")
@@ -144,6 +479,149 @@ class UserInteraction:
             return False
 
 
+class PreflightFailed(Exception):
+    pass
+
+
+class PreflightChecks:
+    """
+    Automated replacement for the UserInteraction prompts, used in unattended (--yes) mode.
+    All checks run in background threads so probing tools can start right away,
+    ResourceExecutor waits for them (wait_for_preflight) before the first install starts.
+    """
+
+    def __init__(self, network_probe: str = CORP_NETWORK_PROBE):
+        self.network_probe = network_probe
+        self._futures = {}
+        self._passed = None
+        # Issues that don't fail the run, e.g. an unwritable build cache only means builds aren't cached
+        self.warnings = []
+        self._lock = threading.Lock()
+
+    def start(self) -> 'PreflightChecks':
+        import concurrent.futures
+
+        checks = {
+            'corporate network': self.check_network,
+            'username and home directory': self.check_user,
+            'free disk space': self.check_disk_space,
+            'write access': self.check_write_access,
+            'passwordless sudo': self.check_sudo,
+        }
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(checks), thread_name_prefix='preflight')
+        self._futures = {name: executor.submit(check) for name, check in checks.items()}
+        executor.shutdown(wait=False)
+        return self
+
+    def check_network(self) -> tuple[bool, str]:
+        if not self.network_probe:
+            return False, 'no probe configured, pass --network-probe or set SETUP_LAPTOP_NETWORK_PROBE'
+        host, _, port = self.network_probe.rpartition(':')
+        if not host or not port.isdigit():
+            return False, f"invalid probe '{self.network_probe}', expected host:port"
+        import socket
+
+        try:
+            with socket.create_connection((host, int(port)), timeout=NETWORK_PROBE_TIMEOUT_SECONDS):
+                return True, f'{self.network_probe} is reachable'
+        except OSError as e:
+            return False, f'{self.network_probe} is not reachable ({e}), connect to CORS-CORP wifi or VPN'
+
+    def check_user(self) -> tuple[bool, str]:
+        import getpass
+        import pwd
+
+        username = getpass.getuser()
+        home = os.path.expanduser('~')
+        if not os.path.isdir(home):
+            return False, f'home directory {home} does not exist'
+        account_home = pwd.getpwnam(username).pw_dir
+        if os.path.realpath(account_home) != os.path.realpath(home):
+            return False, f'$HOME is {home} but the home of {username} is {account_home}'
+        if os.path.basename(home) != username:
+            return False, f'home directory {home} does not match username {username}, please contact IT'
+        return True, f'{username} ({home})'
+
+    def check_disk_space(self) -> tuple[bool, str]:
+        import shutil
+
+        free_gb = shutil.disk_usage(os.path.expanduser('~')).free / 1024 ** 3
+        if free_gb < MIN_FREE_DISK_GB:
+            return False, f'{free_gb:.1f} GB free, at least {MIN_FREE_DISK_GB} GB needed'
+        return True, f'{free_gb:.1f} GB free'
+
+    def check_write_access(self) -> tuple[bool, str]:
+        def is_writable(target: str) -> bool:
+            # Targets may not exist yet, then the directory they will be created in must be writable
+            path = os.path.abspath(target)
+            while not os.path.exists(path) and os.path.dirname(path) != path:
+                path = os.path.dirname(path)
+            return os.access(path, os.W_OK)
+
+        import platform
+
+        targets = [
+            os.path.expanduser('~/.zshrc'),
+            os.environ.get('PYENV_ROOT', os.path.expanduser('~/.pyenv')),
+            os.path.expanduser('~/.nvm'),
+            '/usr/local/bin',  # imgcat is symlinked here without sudo
+        ]
+        # A missing Homebrew prefix is created by its installer with sudo, which check_sudo covers
+        default_brew_prefix = '/opt/homebrew' if platform.machine() == 'arm64' else '/usr/local'
+        brew_prefix = os.environ.get('HOMEBREW_PREFIX', default_brew_prefix)
+        if os.path.exists(brew_prefix):
+            targets.append(brew_prefix)
+        if not is_writable(PYTHON_BUILD_CACHE_DIR):
+            self.warnings.append(f'cannot write to {PYTHON_BUILD_CACHE_DIR}, python builds will not be cached')
+        not_writable = [target for target in targets if not is_writable(target)]
+        if not_writable:
+            return False, 'cannot write to ' + ', '.join(not_writable)
+        return True, f'{len(targets)} target paths are writable'
+
+    def check_sudo(self) -> tuple[bool, str]:
+        # The Homebrew installer, java21 and autoupdate use sudo, nobody is there to type a password
+        try:
+            result = subprocess.run(['sudo', '-n', 'true'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                    timeout=10)
+        except (FileNotFoundError, subprocess.TimeoutExpired) as e:
+            return False, f'could not run sudo ({e})'
+        if result.returncode != 0:
+            return False, 'sudo needs a password, run `sudo -v` first or allow passwordless sudo for this run'
+        return True, 'sudo works without a password'
+
+    def wait(self) -> bool:
+        """Wait for all checks, log the report once and return True if all of them passed."""
+        with self._lock:
+            if self._passed is not None:
+                return self._passed
+
+            self._passed = True
+            log(f"\n{Colors.BOLD}Preflight checks{Colors.ENDC}")
+            for name, future in self._futures.items():
+                try:
+                    ok, detail = future.result()
+                except Exception as e:
+                    ok, detail = False, f'check failed: {e}'
+                self._passed = self._passed and ok
+                if ok:
+                    log(Colors.OKGREEN + f'  ✓ {name}: {detail}' + Colors.ENDC)
+                else:
+                    log(Colors.FAIL + f'  ✗ {name}: {detail}' + Colors.ENDC)
+            for warning in self.warnings:
+                log(Colors.BLUE + f'  ! {warning}' + Colors.ENDC)
+            log("")
+            return self._passed
+
+
+def wait_for_preflight():
+    """
+    Called by ResourceExecutor before installing a missing tool, in unattended mode nothing is
+    changed before the preflight checks have passed.
+    """
+    if PREFLIGHT is not None and not PREFLIGHT.wait() and not DRY_RUN:
+        raise PreflightFailed()
+
+
 def run_command(command, skip_in_dry_run=True):
     """Runs a command in the shell, prints output, and handles errors.
     
@@ -163,10 +641,20 @@ def run_command(command, skip_in_dry_run=True):
 
 
 class Tool:
-    def __init__(self, command, name, install_command=None):
+    def __init__(self, command, name, install_command=None, resources=None, requires=()):
+        """
+        Args:
+            resources: Tokens needed per resource class while installing, e.g. {RESOURCE_NETWORK: 1}.
+                Defaults to a network slot and the brew lock for brew installs, nothing otherwise.
+            requires: Names of tools that have to be installed first.
+        """
         self.command = command
         self.name = name
         self.install_command = install_command if install_command else f'brew install {self.command}'
+        if resources is None:
+            resources = {RESOURCE_NETWORK: 1, RESOURCE_BREW_LOCK: 1} if self.install_command.startswith('brew ') else {}
+        self.resources = resources
+        self.requires = tuple(requires)
 
     def is_installed(self) -> bool:
         """Check if the tool is already installed. Returns True if installed, False otherwise."""
@@ -370,15 +858,12 @@ class Tool:
                 log(Colors.FAIL + f"{self.name} is not installed." + Colors.ENDC)
                 return False
 
-    def install(self) -> bool:
+    def install_missing(self) -> bool:
         """
-        Installs the tool using provided installation command if not already installed.
-        Returns True if installed successfully or already installed, False otherwise.
+        Installs the tool using provided installation command. ResourceExecutor only calls this
+        after is_installed() returned False and the preflight checks passed.
+        Returns True if installed successfully, False otherwise.
         """
-        if self.is_installed():
-            return True  # Already installed, nothing to do
-        
-        # Tool is not installed, proceed with installation
         if self.name == 'homebrew':
             try:
                 # Make sure that we create a zshrc file
@@ -532,13 +1017,23 @@ brew() {
             result = subprocess.run(['pyenv', 'versions'], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
             version_exists = PYTHON_VERSION_TO_INSTALL in result.stdout
             
-            if not version_exists:
+            if not version_exists and DRY_RUN:
+                archive_path = get_python_build_archive_path()
+                if os.path.isfile(archive_path):
+                    log(f"{Colors.DIM}  [dry-run] Would restore python {PYTHON_VERSION_TO_INSTALL} from {archive_path}{Colors.ENDC}")
+                else:
+                    log(f"{Colors.DIM}  [dry-run] Would run: pyenv install {PYTHON_VERSION_TO_INSTALL} and cache the build{Colors.ENDC}")
+            elif not version_exists and not restore_python_from_cache():
+                # No cached build, compile using all cores unless the user already set MAKE_OPTS
+                build_env = dict(os.environ)
+                build_env.setdefault('MAKE_OPTS', f'-j{os.cpu_count() or 1}')
                 # Install the version (user may be prompted if version exists)
                 install_result = subprocess.run(
                     f'pyenv install {PYTHON_VERSION_TO_INSTALL}',
                     shell=True,
                     capture_output=True,
-                    text=True
+                    text=True,
+                    env=build_env
                 )
                 if install_result.returncode != 0:
                     # Check if it's because version already exists or user cancelled
@@ -548,6 +1043,8 @@ brew() {
                         # User likely cancelled or other error - don't print error, just skip
                         log(Colors.BLUE + f"Skipping python {PYTHON_VERSION_TO_INSTALL} installation." + Colors.ENDC)
                         return False
+                else:
+                    save_python_to_cache()
             
             # Set as global version
             run_command(f'pyenv global {PYTHON_VERSION_TO_INSTALL}')
@@ -626,6 +1123,128 @@ fi
             return res == 0
 
 
+class TokenPool:
+    """Token counts and wait statistics of one resource class, guarded by the ResourceExecutor's condition."""
+
+    def __init__(self, name: str, size: int):
+        self.name = name
+        self.size = max(1, size)
+        self.available = self.size
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.waits = 0
+
+    def tokens_for(self, count: int) -> int:
+        return min(count, self.size)  # A step asking for more than the pool has gets all of it
+
+    def has_tokens(self, count: int) -> bool:
+        return self.available >= self.tokens_for(count)
+
+    def record_wait(self, seconds: float):
+        self.wait_seconds += seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+        self.waits += 1
+
+
+class ResourceExecutor:
+    """
+    Installs tools concurrently, limited by per resource class token pools.
+    A tool is probed as soon as the tools it requires are done. If it needs installing, it waits
+    until all of its resource classes have tokens and takes them in one go, so a step never sits
+    on a slot while waiting for a lock and steps can't deadlock.
+    """
+
+    def __init__(self, pool_sizes: dict):
+        self.pools = {name: TokenPool(name, size) for name, size in pool_sizes.items()}
+        self._condition = threading.Condition()
+        self._abort = threading.Event()
+
+    def acquire(self, resources: dict):
+        """Take the tokens for all resource classes at once, waiting time is charged to the classes that were short."""
+        with self._condition:
+            waited = {resource: 0.0 for resource in resources}
+            last = time.monotonic()
+            while True:
+                blocking = [r for r, count in resources.items() if not self.pools[r].has_tokens(count)]
+                if not blocking:
+                    break
+                self._condition.wait()
+                now = time.monotonic()
+                for resource in blocking:
+                    waited[resource] += now - last
+                last = now
+            for resource, count in resources.items():
+                pool = self.pools[resource]
+                pool.available -= pool.tokens_for(count)
+                pool.record_wait(waited[resource])
+
+    def release(self, resources: dict):
+        with self._condition:
+            for resource, count in resources.items():
+                self.pools[resource].available += self.pools[resource].tokens_for(count)
+            self._condition.notify_all()
+
+    def run(self, tools, on_done=None) -> list:
+        """Install all tools and return [(name, success)] in the order the tools were given."""
+        import concurrent.futures
+
+        done_events = {tool.name: threading.Event() for tool in tools}
+        results = {}
+        error = None
+
+        def run_tool(tool):
+            try:
+                for required in tool.requires:
+                    done_events[required].wait()
+                if self._abort.is_set():
+                    return False
+
+                # Probes don't need any tokens, only the install itself does
+                if tool.is_installed():
+                    return True
+                wait_for_preflight()
+
+                self.acquire(tool.resources)
+                interactive = RESOURCE_INTERACTIVE in tool.resources
+                try:
+                    if interactive:
+                        ProgressBar.pause()
+                    return tool.install_missing()
+                finally:
+                    if interactive:
+                        ProgressBar.resume()
+                    self.release(tool.resources)
+            finally:
+                done_events[tool.name].set()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(tools), thread_name_prefix='install') as executor:
+            futures = {executor.submit(run_tool, tool): tool for tool in tools}
+            for future in concurrent.futures.as_completed(futures):
+                tool = futures[future]
+                try:
+                    results[tool.name] = future.result()
+                except PreflightFailed as e:
+                    self._abort.set()
+                    error = error or e
+                    results[tool.name] = False
+                except Exception as e:
+                    log(Colors.FAIL + f"Error: An error occurred while installing {tool.name}: {e}" + Colors.ENDC)
+                    results[tool.name] = False
+                if on_done:
+                    on_done(tool.name, results[tool.name])
+
+        if error:
+            raise error
+        return [(tool.name, results[tool.name]) for tool in tools]
+
+    def log_wait_times(self):
+        """Log the time steps spent waiting for each resource class, to help tune the pool sizes."""
+        log(f"\n{Colors.DIM}Time waiting per resource class:{Colors.ENDC}")
+        for pool in self.pools.values():
+            log(f"{Colors.DIM}  {pool.name:<11} {pool.wait_seconds:6.1f}s total, {pool.max_wait_seconds:5.1f}s max "
+                f"over {pool.waits} steps ({pool.size} slots){Colors.ENDC}")
+
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -636,6 +1255,8 @@ Examples:
   %(prog)s              # Normal installation
   %(prog)s --dry-run    # Preview what would be installed
   %(prog)s -n           # Same as --dry-run
+  %(prog)s --yes --network-probe intranet.example.com:443
+                        # Unattended, e.g. from MDM or a bootstrap script
         '''
     )
     parser.add_argument(
@@ -643,7 +1264,29 @@ Examples:
         action='store_true',
         help='Preview what would be installed without making any changes'
     )
-    return parser.parse_args()
+    parser.add_argument(
+        '-y', '--yes',
+        action='store_true',
+        help='Run unattended: replace the prompts with automated preflight checks'
+    )
+    parser.add_argument(
+        '--network-probe',
+        metavar='HOST:PORT',
+        default=CORP_NETWORK_PROBE,
+        help='Host only reachable from the corporate network, checked in unattended mode '
+             '(default: $SETUP_LAPTOP_NETWORK_PROBE)'
+    )
+    parser.add_argument(
+        '--network-slots',
+        type=int,
+        default=NETWORK_SLOTS,
+        help=f'Number of install steps allowed to download at the same time (default: {NETWORK_SLOTS})'
+    )
+    args = parser.parse_args()
+    # The probe replaces the "are you on the corporate network" prompt, it can't be skipped
+    if args.yes and not args.network_probe:
+        parser.error('--yes requires --network-probe HOST:PORT (or SETUP_LAPTOP_NETWORK_PROBE)')
+    return args
 
 
 if __name__ == '__main__':
@@ -656,55 +1299,88 @@ if __name__ == '__main__':
         log(f"\n{Colors.BLUE}{Colors.BOLD}═══ DRY-RUN MODE ═══{Colors.ENDC}")
         log(f"{Colors.DIM}No changes will be made. Preview only.{Colors.ENDC}\n")
     
-    user_interaction = UserInteraction()
-    user_conn_res = user_interaction.ask_user_connection()
-    if not user_conn_res:
-        exit(1)
-
-    if not user_interaction.is_username_correct():
-        exit(1)
-
+    if args.yes:
+        # Keeps the Homebrew installer and brew from waiting for RETURN or a tty
+        os.environ['NONINTERACTIVE'] = '1'
+        # Checks run in the background while the tools are probed
+        PREFLIGHT = PreflightChecks(args.network_probe).start()
+    else:
+        user_interaction = UserInteraction()
+        user_conn_res = user_interaction.ask_user_connection()
+        if not user_conn_res:
+            exit(1)
+
+        if not user_interaction.is_username_correct():
+            exit(1)
+
+    # Everything needs homebrew's PATH setup first, the rest follows the tool's own requirements
+    brew_zshrc_step = {RESOURCE_NETWORK: 1, RESOURCE_BREW_LOCK: 1, RESOURCE_ZSHRC_LOCK: 1}
+    download_step = {RESOURCE_NETWORK: 1}
+    # Curl installers that append to ~/.zshrc themselves
+    download_zshrc_step = {RESOURCE_NETWORK: 1, RESOURCE_ZSHRC_LOCK: 1}
+    # Brew steps running sudo (or casks that may), one at a time so password prompts don't overlap
+    brew_sudo_step = {RESOURCE_NETWORK: 1, RESOURCE_BREW_LOCK: 1, RESOURCE_INTERACTIVE: 1}
     tools = [
-        Tool('brew', 'homebrew'),
-        Tool('nvm', 'nvm'),
-        Tool('node', 'node'),
-        Tool('pyenv', 'pyenv'),
-        Tool('python', 'python'),
-        Tool('uv', 'uv', 'curl -LsSf https://astral.sh/uv/install.sh | sh'),
-        Tool('tfenv', 'tfenv'),
-        Tool('terraform', 'terraform'),
-        Tool('java21', 'java21'),
-        Tool('yarn', 'yarn'),
-        Tool('git', 'git'),
-        Tool('gh', 'github-cli'),
-        Tool('git-hooks-go', 'git-hooks-go', 'brew install git-hooks-go --quiet'),
-        Tool('jq', 'jq'),
-        Tool('postman', 'postman'),
-        Tool('awscli', 'awscli'),
-        Tool('delta', 'git-delta'),
-        Tool('fzf', 'fzf'),
-        Tool('imgcat', 'imgcat', 'ln -sf /Applications/iTerm.app/Contents/Resources/utilities/imgcat /usr/local/bin/imgcat'),
-        Tool('zsh-autosuggestions', 'zsh-autosuggestions'),
-        Tool('zsh-syntax-highlighting', 'zsh-syntax-highlighting'),
-        Tool('zsh-completions', 'zsh-completions'),
-        Tool('lsd', 'lsd'),
-        Tool('bat', 'bat'),
-        Tool('fd', 'fd'),
-        Tool('ag', 'silver-searcher'),
-        Tool('autoupdate', 'autoupdate', 'brew install pinentry-mac && brew tap domt4/autoupdate && brew autoupdate start 18000 --cleanup --upgrade --immediate --sudo'),
+        Tool('brew', 'homebrew', resources={**brew_zshrc_step, RESOURCE_INTERACTIVE: 1}),
+        Tool('nvm', 'nvm', resources=download_zshrc_step, requires=['homebrew']),
+        Tool('node', 'node', resources=download_step, requires=['nvm']),
+        Tool('pyenv', 'pyenv', resources=brew_zshrc_step, requires=['homebrew']),
+        Tool('python', 'python', resources={RESOURCE_CPU: CPU_SLOTS}, requires=['pyenv']),
+        Tool('uv', 'uv', 'curl -LsSf https://astral.sh/uv/install.sh | sh', resources=download_zshrc_step, requires=['homebrew']),
+        Tool('tfenv', 'tfenv', resources=brew_zshrc_step, requires=['homebrew']),
+        Tool('terraform', 'terraform', resources=download_step, requires=['tfenv']),
+        Tool('java21', 'java21', resources={**download_step, RESOURCE_INTERACTIVE: 1}, requires=['homebrew']),
+        Tool('yarn', 'yarn', resources=brew_zshrc_step, requires=['node']),
+        Tool('git', 'git', requires=['homebrew']),
+        Tool('gh', 'github-cli', requires=['homebrew']),
+        Tool('git-hooks-go', 'git-hooks-go', 'brew install git-hooks-go --quiet', requires=['homebrew']),
+        Tool('jq', 'jq', requires=['homebrew']),
+        Tool('postman', 'postman', resources=brew_sudo_step, requires=['homebrew']),
+        Tool('awscli', 'awscli', requires=['homebrew']),
+        Tool('delta', 'git-delta', requires=['homebrew']),
+        Tool('fzf', 'fzf', requires=['homebrew']),
+        Tool('imgcat', 'imgcat', 'ln -sf /Applications/iTerm.app/Contents/Resources/utilities/imgcat /usr/local/bin/imgcat', requires=['homebrew']),
+        Tool('zsh-autosuggestions', 'zsh-autosuggestions', resources=brew_zshrc_step, requires=['homebrew']),
+        Tool('zsh-syntax-highlighting', 'zsh-syntax-highlighting', resources=brew_zshrc_step, requires=['homebrew']),
+        Tool('zsh-completions', 'zsh-completions', requires=['homebrew']),
+        Tool('lsd', 'lsd', requires=['homebrew']),
+        Tool('bat', 'bat', requires=['homebrew']),
+        Tool('fd', 'fd', requires=['homebrew']),
+        Tool('ag', 'silver-searcher', requires=['homebrew']),
+        Tool('autoupdate', 'autoupdate', 'brew install pinentry-mac && brew tap domt4/autoupdate && brew autoupdate start 18000 --cleanup --upgrade --immediate --sudo',
+             resources=brew_sudo_step, requires=['homebrew']),
     ]
 
     log("")  # Initial newline for spacing
     
-    results = []  # Track (name, success) for summary
-    
-    with tqdm(tools, desc="Setting up", unit="tool", 
-              bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]",
-              colour="green", leave=False) as pbar:
-        for tool in pbar:
-            pbar.set_postfix_str(tool.name)
-            success = tool.install()
-            results.append((tool.name, success))
+    executor = ResourceExecutor({
+        RESOURCE_CPU: CPU_SLOTS,
+        RESOURCE_NETWORK: args.network_slots,
+        RESOURCE_BREW_LOCK: 1,
+        RESOURCE_ZSHRC_LOCK: 1,
+        RESOURCE_INTERACTIVE: 1,
+    })
+
+    # Ask for the sudo password once before the bar starts, steps that need it later can reuse it
+    if not args.yes and not DRY_RUN:
+        subprocess.run(['sudo', '-v'])
+
+    try:
+        with ProgressBar(total=len(tools), desc="Setting up") as pbar:
+            def on_done(name, success):
+                pbar.set_postfix_str(name)
+                pbar.update(1)
+
+            # Track (name, success) for summary
+            results = executor.run(tools, on_done=on_done)
+    except PreflightFailed:
+        log(Colors.FAIL + "Preflight checks failed, nothing was changed. Fix the issues above and re-run." + Colors.ENDC)
+        exit(1)
+
+    # Everything may already be installed, still report the checks and fail the unattended run
+    if PREFLIGHT is not None and not PREFLIGHT.wait() and not DRY_RUN:
+        log(Colors.FAIL + "Preflight checks failed. Fix the issues above and re-run." + Colors.ENDC)
+        exit(1)
     
     # Print summary
     succeeded = sum(1 for _, s in results if s)
@@ -731,4 +1407,5 @@ if __name__ == '__main__':
         else:
             log("")
         log(f"\n{Colors.BLUE}Remember to restart your terminal and/or run 'source ~/.zshrc'.{Colors.ENDC}")
+    executor.log_wait_times()
     exit(0)
@@ -47,9 +47,9 @@ if [[ $version != ${PYTHON_VERSION}* ]]; then
     echo "Python ${PYTHON_VERSION} is not installed, starting install..."
     pyenv install "$PYTHON_VERSION"
     pyenv global "$PYTHON_VERSION"
-    python3 -m pip install requests tqdm
+    python3 -m pip install requests
     echo "Please restart your zsh shell."
 else
-    python3 -m pip install requests tqdm
+    python3 -m pip install requests
     echo "Python ${PYTHON_VERSION} is already installed."
 fi
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Startup checks for setup_laptop.py, run with `python3 -m unittest dev_setup/test_setup_laptop.py`."""
+
+import os
+import subprocess
+import sys
+import unittest
+
+SCRIPT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'setup_laptop.py')
+
+# Time spent importing modules on top of interpreter startup, --dry-run should reach its first probe quickly
+IMPORT_BUDGET_MS = 60
+
+# Only needed on specific paths (build cache, preflight, executor), must not be imported on startup
+LAZY_MODULES = ('tqdm', 'tarfile', 'hashlib', 'socket', 'concurrent.futures', 'getpass', 'tempfile', 'platform')
+
+
+def imports_of(args) -> dict:
+    """Run python with -X importtime and return {module: (cumulative microseconds, is top level import)}."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', *args],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    imports = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        # Nested imports are indented below the module importing them
+        imports[name.strip()] = (int(cumulative), not name[1:].startswith(' '))
+    return imports
+
+
+class TestStartup(unittest.TestCase):
+    def setUp(self):
+        self.interpreter_imports = imports_of(['-c', 'pass'])
+        self.script_imports = imports_of([SCRIPT_PATH, '--help'])
+
+    def test_import_time_budget(self):
+        script_only = {name: us for name, (us, top_level) in self.script_imports.items()
+                       if top_level and name not in self.interpreter_imports}
+        total_ms = sum(script_only.values()) / 1000
+        slowest = sorted(script_only.items(), key=lambda item: -item[1])[:5]
+        self.assertLessEqual(total_ms, IMPORT_BUDGET_MS,
+                             f'imports took {total_ms:.1f}ms (budget {IMPORT_BUDGET_MS}ms), slowest: {slowest}')
+
+    def test_lazy_modules_not_imported(self):
+        eager_modules = [module for module in LAZY_MODULES if module in self.script_imports]
+        self.assertEqual(eager_modules, [], 'these modules should only be imported where they are used')
+
+
+if __name__ == '__main__':
+    unittest.main()